@@ -2,19 +2,39 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.update_coordinator import TimestampDataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    CALENDAR_UPDATE_INTERVAL,
+    SENSOR_COORDINATOR,
+    CALENDAR_COORDINATOR,
+)
 from .api import FireworksAPI
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor", "calendar"]
 
+class FireworksSensorCoordinator(TimestampDataUpdateCoordinator):
+    """Coordinator for today's events, shared by the sensors."""
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        # Today's events derived from the current data, filled in by the sensors
+        # as (data, today, events, event_dicts, top_events_flat)
+        self.todays_cache: tuple | None = None
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Fireworks Tonight from a config entry."""
     
@@ -25,26 +45,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     latitude = hass.config.latitude
     longitude = hass.config.longitude
     
-    api = FireworksAPI(postcode, latitude, longitude, max_distance)
+    api = FireworksAPI(hass, postcode, latitude, longitude, max_distance)
+    
+    async def async_update_sensor_data() -> dict[str, Any]:
+        """Fetch today's events, sorted closest first for the sensors."""
+        data = await api.async_get_events()
+        data["events_by_distance"] = sorted(data["events"], key=attrgetter("distance_km"))
+        return data
     
-    coordinator = DataUpdateCoordinator(
+    # Sensors only need today's events but should notice changes sooner, while
+    # the 7-day calendar window can be refreshed much less often
+    sensor_coordinator = FireworksSensorCoordinator(
+        hass,
+        _LOGGER,
+        name=f"{DOMAIN}_sensor",
+        update_method=async_update_sensor_data,
+        update_interval=timedelta(
+            hours=entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        ),
+    )
+    calendar_coordinator = TimestampDataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=DOMAIN,
-        update_method=api.async_get_all_events,  # Fetch 7 days, filter client-side
-        update_interval=timedelta(hours=1),
+        name=f"{DOMAIN}_calendar",
+        update_method=api.async_get_all_events,
+        update_interval=timedelta(hours=CALENDAR_UPDATE_INTERVAL),
     )
     
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data so we have data when entities subscribe. These run one
+    # after the other so the location lookup is only done once.
+    await sensor_coordinator.async_config_entry_first_refresh()
+    await calendar_coordinator.async_config_entry_first_refresh()
     
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = {
+        SENSOR_COORDINATOR: sensor_coordinator,
+        CALENDAR_COORDINATOR: calendar_coordinator,
+    }
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    @callback
+    def _async_refresh_at_midnight(now: datetime) -> None:
+        """Fetch the new day's events as soon as the date changes."""
+        hass.async_create_task(sensor_coordinator.async_request_refresh())
+    
+    # Sensors only hold today's events, so refresh just after local midnight
+    # rather than waiting up to a full update interval for the new day
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_refresh_at_midnight, hour=0, minute=0, second=5)
+    )
+    
+    # Reload when options change so the new update interval takes effect
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
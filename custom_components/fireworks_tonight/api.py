@@ -2,64 +2,113 @@
 import asyncio
 import logging
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List
 
-import aiohttp
 import async_timeout
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class FireworksEvent:
+    """A fireworks event near home."""
+    
+    title: str
+    location: str
+    locality: str
+    latitude: float
+    longitude: float
+    distance_km: float
+    date: str | None
+    start_time: str | None
+    end_time: str | None
+    description: str
+    source: str
+    event_id: int | None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the event as a plain dict for state attributes."""
+        return {
+            "title": self.title,
+            "location": self.location,
+            "locality": self.locality,
+            "coordinates": {
+                "latitude": self.latitude,
+                "longitude": self.longitude
+            },
+            "distance_km": self.distance_km,
+            "date": self.date,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "description": self.description,
+            "source": self.source,
+            "event_id": self.event_id
+        }
+
+@lru_cache(maxsize=1024)
+def _cached_distance(home_lat_rad: float, home_lon_rad: float, cos_home_lat: float, lat: float, lon: float) -> float:
+    """Calculate the distance from home (in radians) to a point (in degrees), in km."""
+    lat2 = math.radians(lat)
+    cos_c = (
+        math.cos(lat2 - home_lat_rad)
+        - cos_home_lat * math.cos(lat2) * (1 - math.cos(math.radians(lon) - home_lon_rad))
+    )
+    
+    return 6371 * math.acos(min(1.0, cos_c))
+
 class FireworksAPI:
     """API client for Fireworks Tonight service."""
     
-    def __init__(self, postcode: str, latitude: float, longitude: float, max_distance: float = 10):
+    def __init__(self, hass: HomeAssistant, postcode: str, latitude: float, longitude: float, max_distance: float = 10):
         """Initialize the API client."""
         self.postcode = postcode
         self.latitude = latitude
         self.longitude = longitude
         self.max_distance = max_distance
+        # Home coordinates never change, so convert them once up front
+        self._home_lat_rad = math.radians(latitude)
+        self._home_lon_rad = math.radians(longitude)
+        self._cos_home_lat = math.cos(self._home_lat_rad)
+        # Bounding box (in degrees) that every event within max_distance falls
+        # inside, using the most poleward latitude so the box never undershoots
+        self._max_deg_lat = max_distance / 111.0
+        cos_box_lat = math.cos(math.radians(min(90.0, abs(latitude) + self._max_deg_lat)))
+        self._max_deg_lon = max_distance / (111.0 * cos_box_lat) if cos_box_lat > 1e-6 else 360.0
         self.base_url = "https://fireworks-tonight.au/api/v1/"
-        self._session = None
-    
-    async def _get_session(self):
-        """Get aiohttp session."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-        return self._session
-    
-    async def async_close(self):
-        """Close aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # Use Home Assistant's shared session so connections are pooled
+        self._session = async_get_clientsession(hass)
+        self._location_id: int | None = None
+        self._locations: dict[str, str] = {}
+        # Validators and payload of the last events response, per URL
+        self._events_cache: dict[str, tuple[str | None, str | None, List[Dict[str, Any]]]] = {}
     
-    def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate the great circle distance between two points on earth (in km)."""
-        # Convert decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Radius of earth in kilometers
-        r = 6371
-        
-        return c * r
+    def _distance_from_home(self, lat: float, lon: float) -> float:
+        """Calculate the distance from home to a point (in km)."""
+        # Venues repeat across days, so cache on coordinates rounded to ~11 m
+        return _cached_distance(
+            self._home_lat_rad, self._home_lon_rad, self._cos_home_lat, round(lat, 4), round(lon, 4)
+        )
     
     async def _get_locations(self, postcode_prefix: str) -> str | None:
         """Get locations by postcode prefix."""
-        session = await self._get_session()
+        # Reuse earlier lookups so retries after a failed ID lookup skip this request
+        if postcode_prefix in self._locations:
+            return self._locations[postcode_prefix]
+        
         url = f"{self.base_url}locations?startswith={postcode_prefix}"
         
         try:
             async with async_timeout.timeout(10):
-                async with session.get(url) as response:
+                async with self._session.get(url) as response:
                     response.raise_for_status()
                     data = await response.json()
-                    return data[0] if data else None
+                    if not data:
+                        return None
+                    self._locations[postcode_prefix] = data[0]
+                    return data[0]
         except Exception as err:
             _LOGGER.error("Error getting locations: %s", err)
             return None
@@ -71,12 +120,11 @@ class FireworksAPI:
             return None
         
         parts = location.split(',')
-        session = await self._get_session()
         url = f"{self.base_url}locations?locality={parts[0].strip().lower()}&postcode={parts[1].strip()}"
         
         try:
             async with async_timeout.timeout(10):
-                async with session.get(url) as response:
+                async with self._session.get(url) as response:
                     response.raise_for_status()
                     data = await response.json()
                     return data[0]['id'] if data else None
@@ -86,14 +134,32 @@ class FireworksAPI:
     
     async def _get_events(self, location_id: int, days: int = 1) -> List[Dict[str, Any]]:
         """Get events for a location."""
-        session = await self._get_session()
         url = f"{self.base_url}events?location={location_id}&days={days}"
         
+        # Make the request conditional so unchanged events come back as an empty 304
+        headers = {}
+        cached = self._events_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
         try:
             async with async_timeout.timeout(10):
-                async with session.get(url) as response:
+                async with self._session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        return cached[2]
                     response.raise_for_status()
                     data = await response.json()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._events_cache[url] = (etag, last_modified, data)
+                    else:
+                        # Never revalidate against validators older than this payload
+                        self._events_cache.pop(url, None)
                     return data
         except Exception as err:
             _LOGGER.error("Error getting events: %s", err)
@@ -110,45 +176,50 @@ class FireworksAPI:
     async def _get_events_for_days(self, days: int) -> Dict[str, Any]:
         """Get nearby fireworks events for specified number of days."""
         try:
-            location_id = await self._get_location_id(self.postcode)
-            if not location_id:
+            # The postcode is fixed for the lifetime of the entry, so only
+            # resolve the location ID once and reuse it on later refreshes
+            if self._location_id is None:
+                self._location_id = await self._get_location_id(self.postcode)
+            if not self._location_id:
                 _LOGGER.warning("Could not find location for postcode: %s", self.postcode)
                 return {"event_count": 0, "events": []}
             
-            events = await self._get_events(location_id, days=days)
+            events = await self._get_events(self._location_id, days=days)
             nearby_events = []
             
             for event in events:
-                location = event.get('location', {})
-                coordinates = location.get('coordinates', {})
-                event_lat = coordinates.get('latitude')
-                event_lon = coordinates.get('longitude')
+                # "or {}" also covers nulls, which would otherwise abort the whole refresh
+                location = event.get('location') or {}
+                coords = location.get('coordinates') or {}
+                event_lat = coords.get('latitude')
+                event_lon = coords.get('longitude')
                 
                 if event_lat is None or event_lon is None:
                     continue
                 
+                # Cheap bounding box check before the full distance calculation
+                if (abs(event_lat - self.latitude) > self._max_deg_lat
+                        or abs(event_lon - self.longitude) > self._max_deg_lon):
+                    continue
+                
                 # Calculate distance
-                distance = self.calculate_distance(
-                    self.latitude, self.longitude, event_lat, event_lon
-                )
+                distance = self._distance_from_home(event_lat, event_lon)
                 
                 if distance <= self.max_distance:
-                    nearby_event = {
-                        "title": event.get('name', 'Unknown Event'),  # API uses 'name' not 'title'
-                        "location": event.get('rawlocation', 'Unknown Location'),
-                        "locality": location.get('locality', 'Unknown'),  # Add locality from location object
-                        "coordinates": {
-                            "latitude": event_lat,
-                            "longitude": event_lon
-                        },
-                        "distance_km": round(distance, 2),
-                        "date": event.get('date'),          # Separate date field
-                        "start_time": event.get('start_time'),  # Correct field name
-                        "end_time": event.get('end_time'),      # Correct field name
-                        "description": event.get('description', ''),
-                        "source": event.get('source', ''),
-                        "event_id": event.get('id')
-                    }
+                    nearby_event = FireworksEvent(
+                        title=event.get('name', 'Unknown Event'),  # API uses 'name' not 'title'
+                        location=event.get('rawlocation', 'Unknown Location'),
+                        locality=location.get('locality', 'Unknown'),  # Add locality from location object
+                        latitude=event_lat,
+                        longitude=event_lon,
+                        distance_km=round(distance, 2),
+                        date=event.get('date'),          # Separate date field
+                        start_time=event.get('start_time'),  # Correct field name
+                        end_time=event.get('end_time'),      # Correct field name
+                        description=event.get('description', ''),
+                        source=event.get('source', ''),
+                        event_id=event.get('id'),
+                    )
                     nearby_events.append(nearby_event)
             
             return {
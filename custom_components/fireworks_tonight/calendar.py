@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime, timedelta, tzinfo
+from operator import attrgetter
 from typing import Any
+from zlib import crc32
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
@@ -11,21 +14,31 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
-    DataUpdateCoordinator,
+    TimestampDataUpdateCoordinator,
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .api import FireworksEvent
+from .const import DOMAIN, CALENDAR_COORDINATOR
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fallback formats for combined date/time strings the ISO parser can't handle,
+# including ISO dates with unpadded times such as "9:00"
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M",           # ISO date with HH:MM time
+    "%Y-%m-%d %H:%M:%S",        # ISO date with HH:MM:SS time
+    "%d-%m-%Y %H:%M",           # DD-MM-YYYY with HH:MM time
+    "%d/%m/%Y %H:%M",           # DD/MM/YYYY with HH:MM time
+)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the calendar platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][CALENDAR_COORDINATOR]
     
     entities = [
         FireworksCalendar(coordinator, config_entry),
@@ -38,7 +51,7 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
     
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: TimestampDataUpdateCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the calendar."""
@@ -47,27 +60,46 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
         self._attr_unique_id = f"{config_entry.entry_id}_calendar"
         self._attr_name = "Fireworks"
         self._attr_icon = "mdi:firework"
+        self._warned_missing_id = False
+        self._cached_data: dict[str, Any] | None = None
+        self._cached_events: list[CalendarEvent] = []
+        self._upcoming_index_data: dict[str, Any] | None = None
+        self._upcoming_index: tuple[list[datetime], list[CalendarEvent]] = ([], [])
     
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        events = self._get_calendar_events()
-        if not events:
-            return None
+        ends, next_events = self._get_upcoming_index()
         
-        # Find the next event that hasn't ended yet
-        now = dt_util.utcnow()
-        upcoming_events = [
-            event for event in events 
-            if event.end_datetime_local > now
-        ]
+        # Skip every event that has already ended
+        idx = bisect_right(ends, dt_util.utcnow())
+        return next_events[idx] if idx < len(next_events) else None
+    
+    def _get_upcoming_index(self) -> tuple[list[datetime], list[CalendarEvent]]:
+        """Return event end times in order, with the next event from each position.
         
-        if not upcoming_events:
-            return None
+        next_events[i] is the earliest starting event among those ending at or
+        after ends[i], so bisecting ends by the current time finds the next
+        upcoming event. Rebuilt only when the coordinator data changes.
+        """
+        data = self.coordinator.data
+        if data is self._upcoming_index_data:
+            return self._upcoming_index
+        
+        events = sorted(self._get_calendar_events(), key=attrgetter("end_datetime_local"))
+        ends = [event.end_datetime_local for event in events]
+        
+        next_events = []
+        earliest = None
+        for event in reversed(events):
+            if earliest is None or event.start_datetime_local <= earliest.start_datetime_local:
+                earliest = event
+            next_events.append(earliest)
+        next_events.reverse()
         
-        # Sort by start time and return the earliest
-        upcoming_events.sort(key=lambda x: x.start_datetime_local)
-        return upcoming_events[0]
+        self._upcoming_index_data = data
+        self._upcoming_index = (ends, next_events)
+        return self._upcoming_index
     
     async def async_get_events(
         self,
@@ -89,26 +121,37 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
         return filtered_events
     
     def _get_calendar_events(self) -> list[CalendarEvent]:
+        """Return calendar events, rebuilding them only when the data changes."""
+        # The coordinator replaces its data object on every refresh
+        data = self.coordinator.data
+        if data is not self._cached_data:
+            self._cached_events = self._build_calendar_events(data)
+            self._cached_data = data
+        return self._cached_events
+    
+    def _build_calendar_events(self, data: dict[str, Any] | None) -> list[CalendarEvent]:
         """Convert fireworks events to calendar events."""
         # Use all 7 days of events for calendar
-        if not self.coordinator.data:
+        if not data:
             return []
         
-        events = self.coordinator.data.get("events", [])
+        events = data.get("events", [])
         calendar_events = []
+        # Events don't carry a timezone, so resolve the local one once up front
+        tz = dt_util.DEFAULT_TIME_ZONE
         
         for event in events:
-            date_str = event.get("date")
-            start_time_str = event.get("start_time")
-            end_time_str = event.get("end_time")
+            date_str = event.date
+            start_time_str = event.start_time
+            end_time_str = event.end_time
             
             if not date_str or not start_time_str or not end_time_str:
                 continue
             
             try:
                 # Parse the date and times separately, then combine them
-                start_time = self._parse_datetime_from_parts(date_str, start_time_str)
-                end_time = self._parse_datetime_from_parts(date_str, end_time_str)
+                start_time = self._parse_datetime_from_parts(date_str, start_time_str, tz)
+                end_time = self._parse_datetime_from_parts(date_str, end_time_str, tz)
                 
                 if not start_time or not end_time:
                     continue
@@ -117,10 +160,10 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
                 calendar_event = CalendarEvent(
                     start=start_time,
                     end=end_time,
-                    summary=event.get("locality", "Fireworks Event"),  # Use locality as summary
+                    summary=event.locality,  # Use locality as summary
                     description=self._build_event_description(event),
-                    location=event.get("location", ""),
-                    uid=f"fireworks_{event.get('event_id', hash(str(event)))}",  # Use API ID if available
+                    location=event.location,
+                    uid=f"fireworks_{self._get_event_uid(event)}",
                 )
                 
                 calendar_events.append(calendar_event)
@@ -128,15 +171,29 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
             except Exception as err:
                 _LOGGER.warning(
                     "Failed to parse event times for %s: %s", 
-                    event.get("title", "Unknown"), 
+                    event.title, 
                     err
                 )
                 continue
         
         return calendar_events
     
-    def _parse_datetime_from_parts(self, date_str: str, time_str: str) -> datetime | None:
-        """Parse datetime from separate date and time strings."""
+    def _get_event_uid(self, event: FireworksEvent) -> int:
+        """Return the API ID for an event, or a stable digest of its key fields."""
+        if event.event_id is not None:
+            return event.event_id
+        
+        if not self._warned_missing_id:
+            _LOGGER.warning("Event without an ID from the API, deriving calendar UIDs from its details")
+            self._warned_missing_id = True
+        
+        key = f"{event.date}|{event.start_time}|{event.location}"
+        return crc32(key.encode())
+    
+    def _parse_datetime_from_parts(
+        self, date_str: str, time_str: str, tz: tzinfo
+    ) -> datetime | None:
+        """Parse datetime in the given timezone from separate date and time strings."""
         if not date_str or not time_str:
             return None
         
@@ -145,20 +202,19 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
             # Combine them into a single datetime string
             combined_str = f"{date_str} {time_str}"
             
-            # Try different combined formats
-            formats_to_try = [
-                "%Y-%m-%d %H:%M",           # ISO date with HH:MM time
-                "%Y-%m-%d %H:%M:%S",        # ISO date with HH:MM:SS time
-                "%d-%m-%Y %H:%M",           # DD-MM-YYYY with HH:MM time
-                "%d/%m/%Y %H:%M",           # DD/MM/YYYY with HH:MM time
-            ]
+            # Fast path for the ISO date with HH:MM or HH:MM:SS time the API returns
+            try:
+                dt = datetime.fromisoformat(combined_str)
+                # Assume local timezone since API doesn't specify
+                return dt.replace(tzinfo=tz)
+            except ValueError:
+                pass
             
-            for fmt in formats_to_try:
+            for fmt in DATETIME_FORMATS:
                 try:
                     dt = datetime.strptime(combined_str, fmt)
                     # Assume local timezone since API doesn't specify
-                    dt = dt_util.as_local(dt)
-                    return dt
+                    return dt.replace(tzinfo=tz)
                 except ValueError:
                     continue
             
@@ -169,30 +225,24 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
             _LOGGER.warning("Error parsing date/time %s %s: %s", date_str, time_str, err)
             return None
     
-    def _build_event_description(self, event: dict[str, Any]) -> str:
+    def _build_event_description(self, event: FireworksEvent) -> str:
         """Build a description for the calendar event."""
         description_parts = []
         
         # Add location as the first item
-        location = event.get("location")
-        if location:
-            description_parts.append(f"• Location: {location}")
+        if event.location:
+            description_parts.append(f"• Location: {event.location}")
         
         # Add distance information
-        distance = event.get("distance_km")
-        if distance is not None:
-            description_parts.append(f"• Distance: {distance:.1f} km from home")
+        description_parts.append(f"• Distance: {event.distance_km:.1f} km from home")
         
         # Add coordinates
-        coords = event.get("coordinates", {})
-        if coords.get("latitude") and coords.get("longitude"):
-            lat = coords["latitude"]
-            lon = coords["longitude"]
-            description_parts.append(f"• Coordinates: {lat}, {lon}")
+        if event.latitude and event.longitude:
+            description_parts.append(f"• Coordinates: {event.latitude}, {event.longitude}")
         
         # Add original description if it exists
-        if event.get("description"):
-            description_parts.append(f"• Details: {event['description']}")
+        if event.description:
+            description_parts.append(f"• Details: {event.description}")
         
         # Format as a clean bulleted list
         return "\n".join(description_parts)
@@ -209,5 +259,9 @@ class FireworksCalendar(CoordinatorEntity, CalendarEntity):
         return {
             "postcode": postcode,
             "total_events": len(events),
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": (
+                self.coordinator.last_update_success_time.isoformat()
+                if self.coordinator.last_update_success_time
+                else None
+            ),
         }
\ No newline at end of file
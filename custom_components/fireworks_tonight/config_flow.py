@@ -3,16 +3,31 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_POSTCODE, CONF_MAX_DISTANCE, DEFAULT_MAX_DISTANCE
+from .const import (
+    DOMAIN,
+    CONF_POSTCODE,
+    CONF_MAX_DISTANCE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_DISTANCE,
+    DEFAULT_UPDATE_INTERVAL,
+)
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Fireworks Tonight."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, any] | None = None
     ) -> FlowResult:
@@ -42,4 +57,28 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             ),
             errors=errors,
+        )
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for Fireworks Tonight."""
+
+    async def async_step_init(
+        self, user_input: dict[str, any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+                }
+            ),
         )
\ No newline at end of file
@@ -4,8 +4,16 @@ DOMAIN = "fireworks_tonight"
 
 CONF_POSTCODE = "postcode"
 CONF_MAX_DISTANCE = "max_distance"
+CONF_UPDATE_INTERVAL = "update_interval_hours"
 
 DEFAULT_MAX_DISTANCE = 10
+DEFAULT_UPDATE_INTERVAL = 3  # hours, today's events for the sensors
+CALENDAR_UPDATE_INTERVAL = 12  # hours, 7 days of events for the calendar
+
+MAX_FLAT_EVENTS = 3  # closest events exposed as event_N_* sensor attributes
+
+SENSOR_COORDINATOR = "sensor_coordinator"
+CALENDAR_COORDINATOR = "calendar_coordinator"
 
 ATTR_EVENT_COUNT = "event_count"
 ATTR_EVENTS = "events"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,20 +15,65 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
-    DataUpdateCoordinator,
 )
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from . import FireworksSensorCoordinator
+from .api import FireworksEvent
+from .const import DOMAIN, MAX_FLAT_EVENTS, SENSOR_COORDINATOR
 
 _LOGGER = logging.getLogger(__name__)
 
+_FLAT_EVENT_FIELDS = ("title", "location", "locality", "distance_km", "start_time")
+_get_flat_event_fields = attrgetter(*_FLAT_EVENT_FIELDS)
+
+def _get_todays_cache(
+    coordinator: FireworksSensorCoordinator,
+) -> tuple[list[FireworksEvent], list[dict[str, Any]], dict[str, Any]]:
+    """Return today's events, as attribute dicts and as flattened attributes.
+    
+    The coordinator only fetches today's events and is refreshed just after
+    local midnight, but this guards against showing yesterday's events if
+    that refresh is late or fails. The result is cached on the coordinator so all sensors share a single
+    filter pass per refresh (and per day) instead of one per state read.
+    """
+    data = coordinator.data
+    if not data:
+        return [], [], {}
+    
+    today = dt_util.now().date().isoformat()  # Format: "2025-11-25"
+    
+    cached = coordinator.todays_cache
+    if cached and cached[0] is data and cached[1] == today:
+        return cached[2:]
+    
+    # Filter the presorted list so today's events stay ordered closest first
+    todays_events = [event for event in data.get("events_by_distance", []) if event.date == today]
+    # The events attribute keeps the order the API returned them in
+    todays_event_dicts = [event.as_dict() for event in data.get("events", []) if event.date == today]
+    
+    # Individual event details as separate attributes for the closest few events
+    top_events_flat = {}
+    for i, event in enumerate(todays_events[:MAX_FLAT_EVENTS], start=1):
+        for field, value in zip(_FLAT_EVENT_FIELDS, _get_flat_event_fields(event)):
+            top_events_flat[f"event_{i}_{field}"] = value
+    
+    coordinator.todays_cache = (
+        data, today, todays_events, todays_event_dicts, top_events_flat
+    )
+    return todays_events, todays_event_dicts, top_events_flat
+
+def _get_todays_events(coordinator: FireworksSensorCoordinator) -> list[FireworksEvent]:
+    """Filter events to only include today's events."""
+    return _get_todays_cache(coordinator)[0]
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][SENSOR_COORDINATOR]
     
     entities = [
         FireworksCountSensor(coordinator, config_entry),
@@ -43,7 +88,7 @@ class FireworksCountSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: FireworksSensorCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
@@ -54,22 +99,10 @@ class FireworksCountSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:firework"
         self._attr_state_class = SensorStateClass.MEASUREMENT
     
-    def _get_todays_events(self) -> list:
-        """Filter events to only include today's events."""
-        if not self.coordinator.data:
-            return []
-        
-        from datetime import date
-        today = date.today().isoformat()  # Format: "2025-11-25"
-        
-        all_events = self.coordinator.data.get("events", [])
-        todays_events = [event for event in all_events if event.get("date") == today]
-        return todays_events
-    
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return len(self._get_todays_events())
+        return len(_get_todays_events(self.coordinator))
     
     @property
     def native_unit_of_measurement(self) -> str:
@@ -88,7 +121,11 @@ class FireworksCountSensor(CoordinatorEntity, SensorEntity):
         return {
             "postcode": postcode,
             "max_distance_km": max_distance,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": (
+                self.coordinator.last_update_success_time.isoformat()
+                if self.coordinator.last_update_success_time
+                else None
+            ),
         }
 
 class FireworksEventsSensor(CoordinatorEntity, SensorEntity):
@@ -96,7 +133,7 @@ class FireworksEventsSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: FireworksSensorCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
@@ -106,22 +143,10 @@ class FireworksEventsSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"Fireworks Tonight Events"
         self._attr_icon = "mdi:firework"
     
-    def _get_todays_events(self) -> list:
-        """Filter events to only include today's events."""
-        if not self.coordinator.data:
-            return []
-        
-        from datetime import date
-        today = date.today().isoformat()  # Format: "2025-11-25"
-        
-        all_events = self.coordinator.data.get("events", [])
-        todays_events = [event for event in all_events if event.get("date") == today]
-        return todays_events
-    
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        events = self._get_todays_events()
+        events = _get_todays_events(self.coordinator)
         event_count = len(events)
         if event_count == 0:
             return "No events"
@@ -133,7 +158,7 @@ class FireworksEventsSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes with event details."""
-        events = self._get_todays_events()
+        _, events, top_events_flat = _get_todays_cache(self.coordinator)
         postcode = self.config_entry.data.get("postcode", "Unknown")
         max_distance = self.config_entry.data.get("max_distance", 10)
         
@@ -142,17 +167,16 @@ class FireworksEventsSensor(CoordinatorEntity, SensorEntity):
             "max_distance_km": max_distance,
             "event_count": len(events),
             "events": events,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": (
+                self.coordinator.last_update_success_time.isoformat()
+                if self.coordinator.last_update_success_time
+                else None
+            ),
         }
         
         # Add individual event details as separate attributes for easy access
-        for i, event in enumerate(events):
-            attributes[f"event_{i+1}_title"] = event.get("title", "Unknown")
-            attributes[f"event_{i+1}_location"] = event.get("location", "Unknown")
-            attributes[f"event_{i+1}_locality"] = event.get("locality", "Unknown")
-            attributes[f"event_{i+1}_distance_km"] = event.get("distance_km", 0)
-            attributes[f"event_{i+1}_start_time"] = event.get("start_time", "Unknown")
-            
+        attributes.update(top_events_flat)
+        
         return attributes
 
 class FireworksClosestEventSensor(CoordinatorEntity, SensorEntity):
@@ -160,7 +184,7 @@ class FireworksClosestEventSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: FireworksSensorCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
@@ -170,33 +194,21 @@ class FireworksClosestEventSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"Fireworks Tonight Closest Event"
         self._attr_icon = "mdi:map-marker-distance"
     
-    def _get_todays_events(self) -> list:
-        """Filter events to only include today's events."""
-        if not self.coordinator.data:
-            return []
-        
-        from datetime import date
-        today = date.today().isoformat()  # Format: "2025-11-25"
-        
-        all_events = self.coordinator.data.get("events", [])
-        todays_events = [event for event in all_events if event.get("date") == today]
-        return todays_events
-    
     @property
     def native_value(self) -> str:
         """Return the location of the closest event."""
-        events = self._get_todays_events()
+        events = _get_todays_events(self.coordinator)
         if not events:
             return "No events"
         
-        # Sort events by distance and get the closest one
-        closest_event = min(events, key=lambda x: x.get("distance_km", float('inf')))
-        return closest_event.get("location", "Unknown Location")
+        # Events are already sorted by distance, so the first is the closest
+        closest_event = events[0]
+        return closest_event.location
     
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes with closest event details."""
-        events = self._get_todays_events()
+        events = _get_todays_events(self.coordinator)
         postcode = self.config_entry.data.get("postcode", "Unknown")
         max_distance = self.config_entry.data.get("max_distance", 10)
         
@@ -204,27 +216,34 @@ class FireworksClosestEventSensor(CoordinatorEntity, SensorEntity):
             "postcode": postcode,
             "max_distance_km": max_distance,
             "total_events": len(events),
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": (
+                self.coordinator.last_update_success_time.isoformat()
+                if self.coordinator.last_update_success_time
+                else None
+            ),
         }
         
         if not events:
             return base_attributes
         
-        # Find the closest event
-        closest_event = min(events, key=lambda x: x.get("distance_km", float('inf')))
+        # Events are already sorted by distance, so the first is the closest
+        closest_event = events[0]
         
         # Add all details of the closest event as attributes
         base_attributes.update({
-            "title": closest_event.get("title", "Unknown Event"),
-            "location": closest_event.get("location", "Unknown Location"),
-            "locality": closest_event.get("locality", "Unknown"),
-            "distance_km": closest_event.get("distance_km", 0),
-            "coordinates": closest_event.get("coordinates", {}),
-            "latitude": closest_event.get("coordinates", {}).get("latitude"),
-            "longitude": closest_event.get("coordinates", {}).get("longitude"),
-            "start_time": closest_event.get("start_time", "Unknown"),
-            "end_time": closest_event.get("end_time", "Unknown"),
-            "description": closest_event.get("description", ""),
+            "title": closest_event.title,
+            "location": closest_event.location,
+            "locality": closest_event.locality,
+            "distance_km": closest_event.distance_km,
+            "coordinates": {
+                "latitude": closest_event.latitude,
+                "longitude": closest_event.longitude,
+            },
+            "latitude": closest_event.latitude,
+            "longitude": closest_event.longitude,
+            "start_time": closest_event.start_time,
+            "end_time": closest_event.end_time,
+            "description": closest_event.description,
         })
         
         return base_attributes
\ No newline at end of file